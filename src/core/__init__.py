@@ -9,4 +9,4 @@ from .process import Process
 from .resource import Resource
 from .system import System
 
-__all__ = ['Process', 'Resource', 'System']
+__all__ = ('Process', 'Resource', 'System')
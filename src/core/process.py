@@ -2,6 +2,9 @@ class Process:
     """
     Represents a process or thread in the system that can request and hold resources.
     """
+    # Fixed attribute set: no per-instance __dict__ for the many processes a scenario creates
+    __slots__ = ('pid', 'resources_held', 'resources_requested', 'status')
+
     def __init__(self, pid):
         self.pid = pid  # Process ID
         self.resources_held = []  # Resources currently held by this process
@@ -2,6 +2,9 @@ class Resource:
     """
     Represents a system resource that can be requested and held by processes.
     """
+    # Attributes are fixed, so skip the per-instance __dict__
+    __slots__ = ('rid', 'total_instances', 'available_instances', 'allocated_to')
+
     def __init__(self, rid, instances=1):
         self.rid = rid  # Resource ID
         self.total_instances = instances  # Total number of resource instances
@@ -7,4 +7,4 @@ including resource allocation graph analysis and the banker's algorithm.
 
 from .detector import DeadlockDetector
 
-__all__ = ['DeadlockDetector']
+__all__ = ('DeadlockDetector',)
@@ -1,5 +1,8 @@
+import logging
 import networkx as nx
-import matplotlib.pyplot as plt
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
 class DeadlockDetector:
     """
@@ -23,22 +26,23 @@ class DeadlockDetector:
         # Check for cycles in the graph
         try:
             cycle = nx.find_cycle(rag, orientation='original')
-            print("🔴 Deadlock detected! Cycle found:")
+            # Only format the cycle when someone is listening
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("🔴 Deadlock detected! Cycle found: %s",
+                            ", ".join(f"{edge[0]} → {edge[1]}" for edge in cycle))
             
             # Extract process IDs from the cycle
             deadlocked_processes = set()
             for edge in cycle:
-                print(f"{edge[0]} → {edge[1]}")
-                # If the node is a process (starts with 'P'), extract the PID
-                if edge[0].startswith('P'):
+                # Every node of a cycle is the source of exactly one of its
+                # edges, so checking sources alone finds each process once
+                if edge[0][0] == 'P':
                     deadlocked_processes.add(int(edge[0][1:]))
-                if edge[1].startswith('P'):
-                    deadlocked_processes.add(int(edge[1][1:]))
             
             return True, list(deadlocked_processes)
             
         except nx.NetworkXNoCycle:
-            print("🟢 No deadlock detected.")
+            logger.info("🟢 No deadlock detected.")
             return False, []
     
     def detect_using_bankers_algorithm(self):
@@ -51,33 +55,31 @@ class DeadlockDetector:
         # Prepare data structures for banker's algorithm
         allocation = {}
         max_demand = {}
-        available = []
         
         # Get resource IDs in sorted order for consistency
         resource_ids = sorted(self.system.resources.keys())
         
+        # Resolve resources once; every row below walks the same ordered list
+        resources = [self.system.resources[rid] for rid in resource_ids]
+        
         # Calculate available resources
-        for rid in resource_ids:
-            resource = self.system.resources[rid]
-            available.append(resource.available_instances)
+        available = [resource.available_instances for resource in resources]
         
         # Build allocation and max_demand matrices
-        for pid in self.system.processes:
-            process = self.system.processes[pid]
-            allocation[f'P{pid}'] = []
-            max_demand[f'P{pid}'] = []
+        for pid, process in self.system.processes.items():
+            # Set of requested IDs makes each membership test O(1) instead of a list scan
+            requested = {r.rid for r in process.resources_requested}
+            allocated = [resource.allocated_to.get(pid, 0) for resource in resources]
+            allocation[f'P{pid}'] = allocated
             
-            for rid in resource_ids:
-                resource = self.system.resources[rid]
-                # Current allocation
-                allocated = resource.allocated_to.get(pid, 0)
-                allocation[f'P{pid}'].append(allocated)
-                
-                # For max_demand, we'll use a simple heuristic:
-                # current allocation + 1 for each requested resource
-                # This is a simplified approach since we don't track max demand in our system
-                max_need = allocated + (1 if resource in process.resources_requested else 0)
-                max_demand[f'P{pid}'].append(max(max_need, 1))  # At least 1 to avoid trivial cases
+            # For max_demand, we'll use a simple heuristic:
+            # current allocation + 1 for each requested resource
+            # This is a simplified approach since we don't track max demand in our system
+            # (at least 1 to avoid trivial cases)
+            max_demand[f'P{pid}'] = [
+                max(held + (1 if resource.rid in requested else 0), 1)
+                for resource, held in zip(resources, allocated)
+            ]
         
         # Run banker's algorithm
         is_safe = self._is_safe_state(available, max_demand, allocation)
@@ -86,11 +88,8 @@ class DeadlockDetector:
             return False, []
         else:
             # If not safe, find which processes are involved
-            deadlocked_processes = []
-            for pid in self.system.processes:
-                process = self.system.processes[pid]
-                if process.status == "WAITING":
-                    deadlocked_processes.append(pid)
+            deadlocked_processes = [pid for pid, process in self.system.processes.items()
+                                    if process.status == "WAITING"]
             return True, deadlocked_processes
     
     def _create_resource_allocation_graph(self):
@@ -101,24 +100,28 @@ class DeadlockDetector:
             nx.DiGraph: The resource allocation graph
         """
         rag = nx.DiGraph()
+        # Bind the containers and edge adder once for the loops below
+        processes = self.system.processes
+        resources = self.system.resources
+        add_edge = rag.add_edge
         
         # Add process nodes
-        for pid in self.system.processes:
+        for pid in processes:
             rag.add_node(f'P{pid}', type='process')
         
         # Add resource nodes
-        for rid in self.system.resources:
+        for rid in resources:
             rag.add_node(f'R{rid}', type='resource')
         
         # Add allocation edges (Resource -> Process)
-        for rid, resource in self.system.resources.items():
+        for rid, resource in resources.items():
             for pid in resource.allocated_to:
-                rag.add_edge(f'R{rid}', f'P{pid}', edge_type='allocation')
+                add_edge(f'R{rid}', f'P{pid}', edge_type='allocation')
         
         # Add request edges (Process -> Resource)
-        for pid, process in self.system.processes.items():
+        for pid, process in processes.items():
             for resource in process.resources_requested:
-                rag.add_edge(f'P{pid}', f'R{resource.rid}', edge_type='request')
+                add_edge(f'P{pid}', f'R{resource.rid}', edge_type='request')
         
         return rag
     
@@ -135,13 +138,11 @@ class DeadlockDetector:
             bool: True if system is in safe state, False otherwise
         """
         processes = list(allocation_dict.keys())
-        resources_len = len(available)
-        max_demand = [max_demand_dict[p] for p in processes]
         allocation = [allocation_dict[p] for p in processes]
 
-        # Calculate need matrix
-        need = [[max_demand[i][j] - allocation[i][j] for j in range(resources_len)] 
-                for i in range(len(processes))]
+        # Calculate need matrix, pairing rows and columns with zip instead of indexing
+        need = [[demand - held for demand, held in zip(max_demand_dict[p], alloc)]
+                for p, alloc in zip(processes, allocation)]
         
         work = available[:]
         finish = [False] * len(processes)
@@ -150,10 +151,9 @@ class DeadlockDetector:
         while True:
             allocated = False
             for i, p in enumerate(processes):
-                if not finish[i] and all(need[i][j] <= work[j] for j in range(resources_len)):
+                if not finish[i] and all(n <= w for n, w in zip(need[i], work)):
                     # Process can complete, so it will return all resources
-                    for j in range(resources_len):
-                        work[j] += allocation[i][j]
+                    work = [w + a for w, a in zip(work, allocation[i])]
                     finish[i] = True
                     safe_sequence.append(p)
                     allocated = True
@@ -162,17 +162,20 @@ class DeadlockDetector:
                 break
 
         if all(finish):
-            print("✅ System is in a safe state.")
-            print("🟢 Safe Sequence:", " → ".join(safe_sequence))
+            logger.info("✅ System is in a safe state.")
+            logger.info("🟢 Safe Sequence: %s", " → ".join(safe_sequence))
             return True
         else:
-            print("❌ System is NOT in a safe state.")
+            logger.info("❌ System is NOT in a safe state.")
             return False
     
     def visualize_resource_allocation_graph(self):
         """
         Visualize the resource allocation graph using matplotlib.
         """
+        # Imported here so detection alone does not pay for loading pyplot
+        import matplotlib.pyplot as plt
+
         rag = self._create_resource_allocation_graph()
         
         # Set up the plot
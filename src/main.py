@@ -6,14 +6,14 @@ This module provides a command-line interface for running
 deadlock simulation scenarios.  
 """
 
-import sys
 import argparse
+import io
+import logging
 import os
 from datetime import datetime
 from src.core import Process, Resource, System
 from src.detection import DeadlockDetector
 from src.resolution import DeadlockResolver
-from src.visualization import DeadlockVisualizer
 
 def create_simple_scenario():
     """
@@ -44,6 +44,11 @@ def create_simple_scenario():
     
     return system
 
+# Scenario name -> factory, looked up once instead of comparing names in main()
+SCENARIOS = {
+    "simple": create_simple_scenario
+}
+
 def print_system_status(system):
     """
     Print the current status of the system.
@@ -51,21 +56,24 @@ def print_system_status(system):
     Args:
         system: The system to print status for
     """
-    print("\n=== System Status ===")
-    print(f"Time: {system.time}")
-    print("\nProcesses:")
+    # Buffer the report and write it once rather than once per line
+    buf = io.StringIO()
+    print("\n=== System Status ===", file=buf)
+    print(f"Time: {system.time}", file=buf)
+    print("\nProcesses:", file=buf)
     for pid, process in system.processes.items():
-        print(f"  {process}")
+        print(f"  {process}", file=buf)
         if process.resources_held:
-            print(f"    Holding resources: {[r.rid for r in process.resources_held]}")
+            print(f"    Holding resources: {[r.rid for r in process.resources_held]}", file=buf)
         if process.resources_requested:
-            print(f"    Waiting for resources: {[r.rid for r in process.resources_requested]}")
+            print(f"    Waiting for resources: {[r.rid for r in process.resources_requested]}", file=buf)
     
-    print("\nResources:")
+    print("\nResources:", file=buf)
     for rid, resource in system.resources.items():
-        print(f"  {resource}")
+        print(f"  {resource}", file=buf)
         if resource.allocated_to:
-            print(f"    Allocated to processes: {resource.allocated_to}")
+            print(f"    Allocated to processes: {resource.allocated_to}", file=buf)
+    print(buf.getvalue(), end="")
 
 def create_visualization_dir():
     """Create a directory for visualization outputs."""
@@ -87,12 +95,20 @@ def has_state_changed(system, prev_state):
     """
     if prev_state is None:
         return True
+    
+    prev_processes = prev_state['processes']
+    prev_resources = prev_state['resources']
+    
+    # Any removed process or resource leaves the counts out of step
+    if (len(system.processes) != len(prev_processes) or
+        len(system.resources) != len(prev_resources)):
+        return True
         
     # Check process states
     for pid, process in system.processes.items():
-        if pid not in prev_state['processes']:
+        if pid not in prev_processes:
             return True
-        prev_process = prev_state['processes'][pid]
+        prev_process = prev_processes[pid]
         if (process.status != prev_process['status'] or
             [r.rid for r in process.resources_held] != prev_process['resources_held'] or
             [r.rid for r in process.resources_requested] != prev_process['resources_requested']):
@@ -100,9 +116,9 @@ def has_state_changed(system, prev_state):
     
     # Check resource states
     for rid, resource in system.resources.items():
-        if rid not in prev_state['resources']:
+        if rid not in prev_resources:
             return True
-        prev_resource = prev_state['resources'][rid]
+        prev_resource = prev_resources[rid]
         if (resource.available_instances != prev_resource['available'] or
             resource.allocated_to != prev_resource['allocated']):
             return True
@@ -153,15 +169,20 @@ def get_state_description(system, deadlocked_processes=None):
     if deadlocked_processes:
         return f"deadlock_detected_P{'_'.join(map(str, deadlocked_processes))}"
     
+    # Bucket waiting and terminated processes in a single pass
+    waiting_processes = []
+    terminated_processes = []
+    for pid, p in system.processes.items():
+        if p.status == "WAITING":
+            waiting_processes.append(pid)
+        elif p.status == "TERMINATED":
+            terminated_processes.append(pid)
+    
     # Check if any process is waiting
-    waiting_processes = [pid for pid, p in system.processes.items() 
-                        if p.status == "WAITING"]
     if waiting_processes:
         return f"processes_waiting_P{'_'.join(map(str, waiting_processes))}"
     
     # Check if any process is terminated
-    terminated_processes = [pid for pid, p in system.processes.items() 
-                          if p.status == "TERMINATED"]
     if terminated_processes:
         return f"processes_terminated_P{'_'.join(map(str, terminated_processes))}"
     
@@ -176,25 +197,34 @@ def main():
                       help="Number of simulation steps to run")
     parser.add_argument("--visualize", action="store_true",
                       help="Enable visualization output")
+    parser.add_argument("--format", choices=["png", "svg"], default="png",
+                      help="Image format for visualization output (svg skips rasterization)")
     args = parser.parse_args()
     
+    # Logging is configured by the entry point, not on library import
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    
     print("=== Deadlock Simulator ===")
     print(f"Running {args.scenario} scenario for {args.steps} steps")
     
     # Create system based on selected scenario
-    if args.scenario == "simple":
-        system = create_simple_scenario()
-    else:
+    create_scenario = SCENARIOS.get(args.scenario)
+    if create_scenario is None:
         print("Other scenarios are not implemented yet.")
         return
+    system = create_scenario()
     
     # Initialize components
     detector = DeadlockDetector(system)
     resolver = DeadlockResolver(system, detector)
-    visualizer = DeadlockVisualizer(system)
     
-    # Create visualization directory if needed
-    vis_dir = create_visualization_dir() if args.visualize else None
+    # Only pay for matplotlib/networkx when visualization is requested
+    visualizer = None
+    vis_dir = None
+    if args.visualize:
+        from src.visualization import DeadlockVisualizer
+        visualizer = DeadlockVisualizer(system)
+        vis_dir = create_visualization_dir()
     
     # Track system state for visualization
     prev_state = None
@@ -203,7 +233,7 @@ def main():
     print_system_status(system)
     if args.visualize:
         visualizer.visualize_current_state()
-        visualizer.save(os.path.join(vis_dir, f"t{system.time}_initial_state.png"))
+        visualizer.save(os.path.join(vis_dir, f"t{system.time}_initial_state.{args.format}"))
         prev_state = capture_system_state(system)
     
     # Run simulation steps
@@ -225,7 +255,7 @@ def main():
             # Visualize state after creating deadlock
             if args.visualize:
                 visualizer.visualize_current_state()
-                visualizer.save(os.path.join(vis_dir, f"t{system.time}_deadlock_created_P1_P2.png"))
+                visualizer.save(os.path.join(vis_dir, f"t{system.time}_deadlock_created_P1_P2.{args.format}"))
                 prev_state = capture_system_state(system)
         
         # Step simulation
@@ -237,8 +267,10 @@ def main():
         if is_deadlocked:
             print(f"Deadlock detected! Processes involved: {deadlocked_processes}")
             if args.visualize:
+                # Filename tag shared by the detection and resolution snapshots
+                pid_tag = '_'.join(map(str, deadlocked_processes))
                 visualizer.visualize_current_state(deadlocked_processes=deadlocked_processes)
-                visualizer.save(os.path.join(vis_dir, f"t{system.time}_deadlock_detected_P{'_'.join(map(str, deadlocked_processes))}.png"))
+                visualizer.save(os.path.join(vis_dir, f"t{system.time}_deadlock_detected_P{pid_tag}.{args.format}"))
                 prev_state = capture_system_state(system)
             
             print("Resolving deadlock...")
@@ -246,7 +278,7 @@ def main():
             
             if args.visualize:
                 visualizer.visualize_current_state()
-                visualizer.save(os.path.join(vis_dir, f"t{system.time}_after_resolution_P{'_'.join(map(str, deadlocked_processes))}.png"))
+                visualizer.save(os.path.join(vis_dir, f"t{system.time}_after_resolution_P{pid_tag}.{args.format}"))
                 prev_state = capture_system_state(system)
         else:
             print("[NO DEADLOCK]")
@@ -254,7 +286,7 @@ def main():
             if args.visualize and has_state_changed(system, prev_state):
                 state_desc = get_state_description(system)
                 visualizer.visualize_current_state()
-                visualizer.save(os.path.join(vis_dir, f"t{system.time}_{state_desc}.png"))
+                visualizer.save(os.path.join(vis_dir, f"t{system.time}_{state_desc}.{args.format}"))
                 prev_state = capture_system_state(system)
         
         # Print system status
@@ -262,6 +294,7 @@ def main():
     
     print("\nSimulation complete.")
     if args.visualize:
+        visualizer.close()
         print(f"\nVisualizations saved in: {vis_dir}")
 
 if __name__ == "__main__":
@@ -7,4 +7,4 @@ including process termination, resource preemption, and rollback.
 
 from .resolver import DeadlockResolver
 
-__all__ = ['DeadlockResolver']
+__all__ = ('DeadlockResolver',)
@@ -1,12 +1,11 @@
 import random
 from typing import List, Dict, Optional
 import logging
-from copy import deepcopy
 from src.core import Process, Resource, System
 from src.detection.detector import DeadlockDetector
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
-
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
 
 class DeadlockResolver:
@@ -14,6 +13,12 @@ class DeadlockResolver:
         self.system = system
         self.detector = detector
         self.resolution_history = []
+        # Strategy name -> bound resolver, built once instead of an if/elif chain per call
+        self._strategies = {
+            "termination": self._resolve_by_termination,
+            "preemption": self._resolve_by_preemption,
+            "rollback": self._resolve_by_rollback
+        }
         random.seed(0)  # For reproducible tests
 
     def allocate_resource(self, process: Process, resource: Resource, instances: int = 1):
@@ -24,7 +29,7 @@ class DeadlockResolver:
         if allocated:
             if resource not in process.resources_held:
                 process.resources_held.append(resource)
-            logging.info(f"Allocated {instances} instances of R{resource.rid} to P{process.pid}")
+            logger.info("Allocated %s instances of R%s to P%s", instances, resource.rid, process.pid)
         else:
             raise ValueError(f"Not enough instances of R{resource.rid} available or allocation failed.")
 
@@ -34,9 +39,9 @@ class DeadlockResolver:
         """
         allocated = process.request_resource(resource, instances)
         if not allocated:
-            logging.info(f"P{process.pid} requested {instances} instances of R{resource.rid} (waiting)")
+            logger.info("P%s requested %s instances of R%s (waiting)", process.pid, instances, resource.rid)
         else:
-            logging.info(f"P{process.pid} successfully allocated {instances} instances of R{resource.rid}")
+            logger.info("P%s successfully allocated %s instances of R%s", process.pid, instances, resource.rid)
 
     def resolve_deadlock(self, strategy: str = "termination", priority_based: bool = False) -> bool:
         """
@@ -52,23 +57,19 @@ class DeadlockResolver:
         is_deadlocked, deadlocked_processes = self.detector.detect_using_resource_allocation_graph()
         
         if not is_deadlocked:
-            logging.info("No deadlock to resolve.")
+            logger.info("No deadlock to resolve.")
             return True
 
-        logging.info(f"Attempting to resolve deadlock using {strategy} strategy...")
+        logger.info("Attempting to resolve deadlock using %s strategy...", strategy)
         self.resolution_history.append({
             'strategy': strategy,
             'deadlocked_processes': deadlocked_processes
         })
 
-        if strategy == "termination":
-            return self._resolve_by_termination(deadlocked_processes, priority_based)
-        elif strategy == "preemption":
-            return self._resolve_by_preemption(deadlocked_processes, priority_based)
-        elif strategy == "rollback":
-            return self._resolve_by_rollback(deadlocked_processes, priority_based)
-        else:
+        resolve = self._strategies.get(strategy)
+        if resolve is None:
             raise ValueError("Invalid strategy. Choose 'termination', 'preemption', or 'rollback'.")
+        return resolve(deadlocked_processes, priority_based)
 
     def _select_process(self, deadlocked_processes: List[int], priority_based: bool) -> Optional[int]:
         """
@@ -98,7 +99,7 @@ class DeadlockResolver:
         process = self.system.processes.get(process_id)
         if not process:
             return False
-        logging.info(f"Terminating process P{process_id}...")
+        logger.info("Terminating process P%s...", process_id)
         process.terminate()
         # Remove all resource requests
         process.resources_requested.clear()
@@ -119,9 +120,9 @@ class DeadlockResolver:
         released = resource.release(process)
         if released:
             process.resources_held.remove(resource)
-            logging.info(f"Preempted all instances of R{resource.rid} from P{process_id}")
+            logger.info("Preempted all instances of R%s from P%s", resource.rid, process_id)
         else:
-            logging.warning(f"Failed to preempt resource R{resource.rid} from P{process_id}")
+            logger.warning("Failed to preempt resource R%s from P%s", resource.rid, process_id)
         return not self.detector.detect_using_resource_allocation_graph()[0]
 
     def _resolve_by_rollback(self, deadlocked_processes: List[int], priority_based: bool) -> bool:
@@ -134,7 +135,7 @@ class DeadlockResolver:
         process = self.system.processes.get(process_id)
         if not process:
             return False
-        logging.info(f"Rolling back process P{process_id}...")
+        logger.info("Rolling back process P%s...", process_id)
         # Release all held resources
         for resource in list(process.resources_held):
             resource.release(process)
@@ -149,26 +150,26 @@ class DeadlockResolver:
         """
         rag_deadlocked, _ = self.detector.detect_using_resource_allocation_graph()
         if rag_deadlocked:
-            logging.error("Verification failed: Deadlock detected in resource allocation graph.")
+            logger.error("Verification failed: Deadlock detected in resource allocation graph.")
             return False
             
         banker_deadlocked, _ = self.detector.detect_using_bankers_algorithm()
         if banker_deadlocked:
-            logging.error("Verification failed: Deadlock detected by banker's algorithm.")
+            logger.error("Verification failed: Deadlock detected by banker's algorithm.")
             return False
 
         for pid, process in self.system.processes.items():
             if process.status not in ["RUNNING", "TERMINATED"]:
-                logging.error(f"Verification failed: Process P{pid} in invalid state {process.status}.")
+                logger.error("Verification failed: Process P%s in invalid state %s.", pid, process.status)
                 return False
 
         for rid, resource in self.system.resources.items():
             allocated = sum(resource.allocated_to.values())
             if allocated + resource.available_instances != resource.total_instances:
-                logging.error(f"Verification failed: Resource R{rid} has inconsistent allocation.")
+                logger.error("Verification failed: Resource R%s has inconsistent allocation.", rid)
                 return False
 
-        logging.info("Verification successful: No deadlocks and system state is consistent.")
+        logger.info("Verification successful: No deadlocks and system state is consistent.")
         return True
 
     def _take_snapshot(self) -> Dict:
@@ -224,7 +225,7 @@ class DeadlockResolver:
         original_snapshot = self._take_snapshot()
         
         for strategy in results.keys():
-            logging.info(f"\nTesting {strategy} strategy...")
+            logger.info("\nTesting %s strategy...", strategy)
             for _ in range(max_attempts):
                 self._restore_snapshot(original_snapshot)
                 if self.resolve_deadlock(strategy, priority_based):
@@ -232,9 +233,9 @@ class DeadlockResolver:
                         results[strategy] += 1
                 self.resolution_history = []
         
-        logging.info("\nTest Results:")
+        logger.info("\nTest Results:")
         for strategy, successes in results.items():
-            logging.info(f"{strategy.capitalize()}: {successes}/{max_attempts} successful")
+            logger.info("%s: %s/%s successful", strategy.capitalize(), successes, max_attempts)
             
         return results
 
@@ -246,6 +247,8 @@ class DeadlockResolver:
 
 # Example test
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
     # Initialize system
     system = System()
     system.resources[1] = Resource(1, 2)  # Resource R1 with 2 instances
@@ -261,7 +264,7 @@ if __name__ == "__main__":
     resolver.request_resource(system.processes[2], system.resources[1], 1)  # P2 requests R1
 
     # Visualize initial RAG
-    logging.info("Initial Resource Allocation Graph:")
+    logger.info("Initial Resource Allocation Graph:")
     system.deadlock_detector = DeadlockDetector(system)
     system.deadlock_detector.visualize_resource_allocation_graph()
 
@@ -270,5 +273,5 @@ if __name__ == "__main__":
     print("Test results:", results)
 
     # Visualize final RAG
-    logging.info("Final Resource Allocation Graph:")
+    logger.info("Final Resource Allocation Graph:")
     system.deadlock_detector.visualize_resource_allocation_graph()
\ No newline at end of file
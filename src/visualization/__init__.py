@@ -5,6 +5,13 @@ This subpackage provides tools for visualizing the state of the system,
 including resource allocation graphs and system matrices.
 """
 
-from .visualizer import DeadlockVisualizer
+__all__ = ('DeadlockVisualizer',)
 
-__all__ = ['DeadlockVisualizer']
+
+def __getattr__(name):
+    """Import the visualizer (and with it matplotlib/networkx) on first access."""
+    if name == 'DeadlockVisualizer':
+        from .visualizer import DeadlockVisualizer
+        globals()[name] = DeadlockVisualizer
+        return DeadlockVisualizer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
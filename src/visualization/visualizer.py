@@ -10,11 +10,10 @@ This module provides visualization capabilities for:
 
 import matplotlib.pyplot as plt
 import networkx as nx
-import numpy as np
-from typing import Dict, List, Tuple, Optional, Set
+from types import MappingProxyType
+from typing import Dict, List, Optional
 from enum import Enum
-import matplotlib.colors as mcolors
-from src.core import System, Process, Resource
+from src.core import System
 
 class NodeType(Enum):
     """Types of nodes in the visualization."""
@@ -32,6 +31,45 @@ class EdgeType(Enum):
     REQUEST = "request"
     RESOLUTION = "resolution"
 
+# Read-only style tables shared by every visualizer instance
+DEFAULT_COLORS = MappingProxyType({
+    NodeType.PROCESS: MappingProxyType({
+        'RUNNING': '#2ecc71',  # Green
+        'WAITING': '#e74c3c',  # Red
+        'TERMINATED': '#95a5a6'  # Gray
+    }),
+    NodeType.RESOURCE: '#3498db',  # Blue
+    EdgeType.ALLOCATION: '#27ae60',  # Dark Green
+    EdgeType.REQUEST: '#c0392b',  # Dark Red
+    EdgeType.RESOLUTION: 'blue'
+})
+
+NODE_SHAPES = MappingProxyType({
+    NodeType.PROCESS: 'o',  # Circle
+    NodeType.RESOURCE: 's'  # Square
+})
+
+EDGE_STYLES = MappingProxyType({
+    EdgeType.ALLOCATION: 'solid',
+    EdgeType.REQUEST: 'dashed',
+    EdgeType.RESOLUTION: 'solid'
+})
+
+# Translucent backing for node labels on full-state figures
+LABEL_BBOX = MappingProxyType({
+    'facecolor': 'white',
+    'edgecolor': 'none',
+    'alpha': 0.7,
+    'pad': 3
+})
+
+# Box drawn behind the per-step explanation text (matplotlib copies it on use)
+EXPLANATION_BBOX = MappingProxyType({
+    'boxstyle': 'round',
+    'facecolor': 'white',
+    'alpha': 0.8
+})
+
 class DeadlockVisualizer:
     """Visualizer for deadlock detection and resolution."""
     
@@ -47,29 +85,13 @@ class DeadlockVisualizer:
         self.ax = None
         self.G = None
         
-        # Define colors and styles
-        self.colors = {
-            NodeType.PROCESS: {
-                'RUNNING': '#2ecc71',  # Green
-                'WAITING': '#e74c3c',  # Red
-                'TERMINATED': '#95a5a6'  # Gray
-            },
-            NodeType.RESOURCE: '#3498db',  # Blue
-            EdgeType.ALLOCATION: '#27ae60',  # Dark Green
-            EdgeType.REQUEST: '#c0392b',  # Dark Red
-            EdgeType.RESOLUTION: 'blue'
-        }
-        
-        self.node_shapes = {
-            NodeType.PROCESS: 'o',  # Circle
-            NodeType.RESOURCE: 's'  # Square
-        }
-        
-        self.edge_styles = {
-            EdgeType.ALLOCATION: 'solid',
-            EdgeType.REQUEST: 'dashed',
-            EdgeType.RESOLUTION: 'solid'
-        }
+        # Define colors and styles; the frozen module table is only a template,
+        # so copy it (including the per-status palette) into a mutable per-instance dict
+        self.colors = {**DEFAULT_COLORS,
+                       NodeType.PROCESS: dict(DEFAULT_COLORS[NodeType.PROCESS])}
+        
+        self.node_shapes = dict(NODE_SHAPES)
+        self.edge_styles = dict(EDGE_STYLES)
         
         # Node sizes
         self.node_size = 2000
@@ -88,6 +110,46 @@ class DeadlockVisualizer:
         
         # Padding for legend
         self.legend_padding = 0.1
+        
+        # Last computed layout, keyed by graph topology and spring constant
+        self._layout_cache = None
+        
+        # Set once the current figure has been shown or saved; only then may
+        # the next draw clear and reuse it instead of opening a new one
+        self._figure_done = False
+
+    def _owns_open_figure(self) -> bool:
+        """
+        Check that self.fig is still the open figure registered under its number.
+        
+        pyplot hands out the lowest free number, so after our window is closed
+        the same number may belong to an unrelated figure. On success the
+        figure is also made current for the pyplot/networkx calls that follow.
+        
+        Returns:
+            bool: True if self.fig is open and now the current figure
+        """
+        if self.fig is None or not plt.fignum_exists(self.fig.number):
+            return False
+        return plt.figure(self.fig.number) is self.fig
+
+    def _reuse_done_figure(self) -> bool:
+        """
+        Clear the current figure for redrawing if it has already been shown or saved.
+        
+        A figure that has been drawn but not yet shown or saved is left alone,
+        so consecutive views all reach the next plt.show().
+        
+        Returns:
+            bool: True if self.fig was cleared and is ready for a new plot
+        """
+        if not self._figure_done or not self._owns_open_figure():
+            return False
+        # Reuse the open figure and its canvas instead of rebuilding them
+        self.fig.clf()
+        self.ax = self.fig.add_subplot()
+        self._figure_done = False
+        return True
 
     def _setup_plot(self, title: str):
         """
@@ -96,12 +158,14 @@ class DeadlockVisualizer:
         Args:
             title: Title for the plot
         """
-        # Close any existing figure
-        if self.fig is not None:
-            plt.close(self.fig)
-        
-        # Create new figure and axis
-        self.fig, self.ax = plt.subplots(figsize=self.figsize, dpi=self.dpi)
+        if not self._reuse_done_figure():
+            # Close any existing figure
+            if self.fig is not None:
+                plt.close(self.fig)
+            
+            # Create new figure and axis
+            self.fig, self.ax = plt.subplots(figsize=self.figsize, dpi=self.dpi)
+            self._figure_done = False
         self.ax.set_title(title, fontsize=self.title_fontsize, pad=20)
         self.ax.set_axis_off()
 
@@ -116,45 +180,94 @@ class DeadlockVisualizer:
         
         # Add process nodes with detailed labels
         for pid, process in self.system.processes.items():
-            # Create detailed process label
-            process_label = f"P{pid}\n"
-            process_label += f"Status: {process.status}\n"
+            # Node name doubles as the first label line
+            name = f"P{pid}"
+            # Create detailed process label from parts joined once
+            label_parts = [name, f"Status: {process.status}"]
             if process.resources_held:
-                process_label += f"Holding: {[r.rid for r in process.resources_held]}\n"
-            if process.resources_requested:
-                process_label += f"Waiting: {[r.rid for r in process.resources_requested]}"
+                label_parts.append(f"Holding: {[r.rid for r in process.resources_held]}")
+            # Labels without a waiting line keep their trailing newline
+            label_parts.append(f"Waiting: {[r.rid for r in process.resources_requested]}"
+                               if process.resources_requested else "")
             
-            G.add_node(f"P{pid}", 
+            G.add_node(name, 
                       type=NodeType.PROCESS,
                       status=process.status,
-                      label=process_label)
+                      label="\n".join(label_parts))
         
         # Add resource nodes with detailed labels
         for rid, resource in self.system.resources.items():
             # Create detailed resource label
-            resource_label = f"R{rid}\n"
-            resource_label += f"Available: {resource.available_instances}/{resource.total_instances}\n"
-            if resource.allocated_to:
-                resource_label += f"Allocated: {resource.allocated_to}"
+            name = f"R{rid}"
+            label_parts = [name,
+                           f"Available: {resource.available_instances}/{resource.total_instances}",
+                           f"Allocated: {resource.allocated_to}" if resource.allocated_to else ""]
             
-            G.add_node(f"R{rid}", 
+            G.add_node(name, 
                       type=NodeType.RESOURCE,
-                      label=resource_label)
+                      label="\n".join(label_parts))
         
         # Add edges
         for pid, process in self.system.processes.items():
+            name = f"P{pid}"
+            
             # Allocation edges
             for resource in process.resources_held:
-                G.add_edge(f"R{resource.rid}", f"P{pid}",
+                G.add_edge(f"R{resource.rid}", name,
                           type=EdgeType.ALLOCATION)
             
             # Request edges
             for resource in process.resources_requested:
-                G.add_edge(f"P{pid}", f"R{resource.rid}",
+                G.add_edge(name, f"R{resource.rid}",
                           type=EdgeType.REQUEST)
         
         return G
 
+    def _split_nodes(self, G: nx.DiGraph):
+        """
+        Split graph nodes into process and resource name lists.
+        
+        Reuses the name strings stored in the graph rather than formatting
+        them again; both lists keep the system's insertion order.
+        
+        Args:
+            G: Graph built by _create_graph
+            
+        Returns:
+            tuple: (process node names, resource node names)
+        """
+        process_nodes = []
+        resource_nodes = []
+        for node, node_type in G.nodes(data='type'):
+            if node_type == NodeType.PROCESS:
+                process_nodes.append(node)
+            elif node_type == NodeType.RESOURCE:
+                resource_nodes.append(node)
+        return process_nodes, resource_nodes
+
+    def _layout(self, G: nx.DiGraph, k: Optional[float] = None) -> Dict:
+        """
+        Compute node positions, reusing the previous layout if the topology is unchanged.
+        
+        The seeded spring layout depends only on node order, edges and k, so
+        snapshots that differ only in labels or statuses share positions.
+        
+        Args:
+            G: The graph to lay out
+            k: Optional spring constant passed to spring_layout
+            
+        Returns:
+            Dict: Mapping from node to position (shared; do not mutate)
+        """
+        key = (k, self.layout_scale, self.layout_seed, tuple(G), frozenset(G.edges()))
+        if self._layout_cache is None or self._layout_cache[0] != key:
+            pos = nx.spring_layout(G,
+                                 scale=self.layout_scale,
+                                 seed=self.layout_seed,
+                                 k=k)
+            self._layout_cache = (key, pos)
+        return self._layout_cache[1]
+
     def _get_node_colors(self, G, nodes=None):
         """
         Get colors for nodes based on their type and state.
@@ -169,13 +282,18 @@ class DeadlockVisualizer:
         if nodes is None:
             nodes = list(G.nodes())
             
+        # Resolve the palette once instead of per node
+        process_colors = self.colors[NodeType.PROCESS]
+        resource_color = self.colors[NodeType.RESOURCE]
+        node_data = G.nodes
+        
         colors = []
         for node in nodes:
-            if G.nodes[node]['type'] == NodeType.PROCESS:
-                status = G.nodes[node]['status']
-                colors.append(self.colors[NodeType.PROCESS][status])
+            data = node_data[node]
+            if data['type'] == NodeType.PROCESS:
+                colors.append(process_colors[data['status']])
             else:
-                colors.append(self.colors[NodeType.RESOURCE])
+                colors.append(resource_color)
         return colors
 
     def _get_node_shapes(self, G: nx.DiGraph) -> List[str]:
@@ -260,15 +378,29 @@ class DeadlockVisualizer:
         Args:
             deadlocked_processes: Optional list of process IDs involved in deadlock
         """
-        # Create figure with specific size and DPI
-        self.fig, self.ax = plt.subplots(figsize=self.figsize, dpi=self.dpi)
+        # Build title with status and time
+        status = "[DEADLOCK DETECTED]" if deadlocked_processes else "[NO DEADLOCK]"
+        title = f"System State at Time {self.system.time}\n{status}"
+        if deadlocked_processes:
+            title += f"\nDeadlocked Processes: {deadlocked_processes}"
+        self._draw_state(title)
+
+    def _draw_state(self, title: str):
+        """
+        Draw the full system graph with labels and legend under the given title.
+        
+        Args:
+            title: Title for the plot
+        """
+        # Reuse a figure that has already been shown or saved, otherwise
+        # create one with specific size and DPI
+        if not self._reuse_done_figure():
+            self.fig, self.ax = plt.subplots(figsize=self.figsize, dpi=self.dpi)
+            self._figure_done = False
         
         # Create and layout graph
         self.G = self._create_graph()
-        pos = nx.spring_layout(self.G, 
-                             scale=self.layout_scale,
-                             seed=self.layout_seed,
-                             k=2.0)  # Increased repulsion
+        pos = self._layout(self.G, k=2.0)  # Increased repulsion
         
         # Draw nodes
         nx.draw_networkx_nodes(self.G, pos,
@@ -291,16 +423,9 @@ class DeadlockVisualizer:
                               labels={node: self.G.nodes[node]['label'] for node in self.G.nodes()},
                               font_size=self.label_fontsize,
                               font_weight='bold',
-                              bbox=dict(facecolor='white',
-                                      edgecolor='none',
-                                      alpha=0.7,
-                                      pad=3))
+                              bbox=LABEL_BBOX)
         
-        # Add title with status and time
-        status = "[DEADLOCK DETECTED]" if deadlocked_processes else "[NO DEADLOCK]"
-        title = f"System State at Time {self.system.time}\n{status}"
-        if deadlocked_processes:
-            title += f"\nDeadlocked Processes: {deadlocked_processes}"
+        # Add title
         plt.title(title,
                  fontsize=self.title_fontsize,
                  pad=20)
@@ -330,27 +455,25 @@ class DeadlockVisualizer:
                 - marked_processes: Set of marked process IDs
                 - explanation: Step explanation
         """
+        # The system does not change between steps, so build the graph,
+        # layout and per-node styling once and reuse them for every figure
+        self.G = self._create_graph()
+        pos = self._layout(self.G)
+        process_nodes, resource_nodes = self._split_nodes(self.G)
+        resource_colors = self._get_node_colors(self.G, resource_nodes)
+        edge_colors = self._get_edge_colors(self.G)
+        edge_styles = self._get_edge_styles(self.G)
+        marked_color = self.colors[NodeType.PROCESS]['RUNNING']
+        unmarked_color = self.colors[NodeType.PROCESS]['WAITING']
+        
         for i, step in enumerate(detection_steps):
             self._setup_plot(f"Deadlock Detection Step {i+1}")
-            self.G = self._create_graph()
-            
-            # Position nodes
-            pos = nx.spring_layout(self.G, 
-                                 scale=self.layout_scale,
-                                 seed=self.layout_seed)
             
-            # Draw nodes
-            process_nodes = [f"P{pid}" for pid in self.system.processes]
-            resource_nodes = [f"R{rid}" for rid in self.system.resources]
-            
-            # Draw process nodes with appropriate colors
-            marked_processes = step['marked_processes']
-            process_colors = []
-            for pid in self.system.processes:
-                node_color = (self.colors[NodeType.PROCESS]['RUNNING'] 
-                            if pid in marked_processes 
-                            else self.colors[NodeType.PROCESS]['WAITING'])
-                process_colors.append(node_color)
+            # Draw process nodes with appropriate colors; callers may pass any
+            # iterable, so take a set once for O(1) membership per process
+            marked_processes = set(step['marked_processes'])
+            process_colors = [marked_color if pid in marked_processes else unmarked_color
+                              for pid in self.system.processes]
             
             nx.draw_networkx_nodes(self.G, pos,
                                  nodelist=process_nodes,
@@ -361,14 +484,14 @@ class DeadlockVisualizer:
             # Draw resource nodes
             nx.draw_networkx_nodes(self.G, pos,
                                  nodelist=resource_nodes,
-                                 node_color=self._get_node_colors(self.G, resource_nodes),
+                                 node_color=resource_colors,
                                  node_size=self.resource_node_size,
                                  alpha=0.7)
             
             # Draw edges
             nx.draw_networkx_edges(self.G, pos,
-                                 edge_color=self._get_edge_colors(self.G),
-                                 style=self._get_edge_styles(self.G),
+                                 edge_color=edge_colors,
+                                 style=edge_styles,
                                  arrowsize=20,
                                  width=2,
                                  alpha=0.7)
@@ -381,7 +504,7 @@ class DeadlockVisualizer:
             self.ax.text(0.02, 0.98, step['explanation'],
                         transform=self.ax.transAxes,
                         verticalalignment='top',
-                        bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
+                        bbox=EXPLANATION_BBOX)
             
             # Add legend
             handles, labels = self._create_legend_elements()
@@ -392,6 +515,7 @@ class DeadlockVisualizer:
             
             plt.tight_layout()
             plt.show()
+            self._figure_done = True
 
     def visualize_resolution_steps(self, resolution_steps: List[Dict]):
         """
@@ -403,37 +527,36 @@ class DeadlockVisualizer:
                 - success: Whether the strategy was successful
                 - state: System state after the strategy
         """
+        # Every step draws the same current system, so lay it out once
+        self.G = self._create_graph()
+        pos = self._layout(self.G)
+        process_nodes, resource_nodes = self._split_nodes(self.G)
+        process_colors = self._get_node_colors(self.G, process_nodes)
+        resource_colors = self._get_node_colors(self.G, resource_nodes)
+        edge_colors = self._get_edge_colors(self.G)
+        edge_styles = self._get_edge_styles(self.G)
+        
         for i, step in enumerate(resolution_steps):
             self._setup_plot(f"Resolution Step {i+1}: {step['strategy'].title()}")
-            self.G = self._create_graph()
-            
-            # Position nodes
-            pos = nx.spring_layout(self.G, 
-                                 scale=self.layout_scale,
-                                 seed=self.layout_seed)
-            
-            # Draw nodes
-            process_nodes = [f"P{pid}" for pid in self.system.processes]
-            resource_nodes = [f"R{rid}" for rid in self.system.resources]
             
             # Draw process nodes
             nx.draw_networkx_nodes(self.G, pos,
                                  nodelist=process_nodes,
-                                 node_color=self._get_node_colors(self.G, process_nodes),
+                                 node_color=process_colors,
                                  node_size=self.node_size,
                                  alpha=0.7)
             
             # Draw resource nodes
             nx.draw_networkx_nodes(self.G, pos,
                                  nodelist=resource_nodes,
-                                 node_color=self._get_node_colors(self.G, resource_nodes),
+                                 node_color=resource_colors,
                                  node_size=self.resource_node_size,
                                  alpha=0.7)
             
             # Draw edges
             nx.draw_networkx_edges(self.G, pos,
-                                 edge_color=self._get_edge_colors(self.G),
-                                 style=self._get_edge_styles(self.G),
+                                 edge_color=edge_colors,
+                                 style=edge_styles,
                                  arrowsize=20,
                                  width=2,
                                  alpha=0.7)
@@ -448,7 +571,7 @@ class DeadlockVisualizer:
             self.ax.text(0.02, 0.98, explanation,
                         transform=self.ax.transAxes,
                         verticalalignment='top',
-                        bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
+                        bbox=EXPLANATION_BBOX)
             
             # Add legend
             handles, labels = self._create_legend_elements()
@@ -459,6 +582,7 @@ class DeadlockVisualizer:
             
             plt.tight_layout()
             plt.show()
+            self._figure_done = True
 
     def set_colors(self, **kwargs):
         """
@@ -475,6 +599,7 @@ class DeadlockVisualizer:
         """Display the current visualization."""
         if self.fig is not None:
             plt.show()
+            self._figure_done = True
             
     def save(self, filename: str):
         """
@@ -488,68 +613,22 @@ class DeadlockVisualizer:
                            bbox_inches='tight',
                            dpi=self.dpi,
                            pad_inches=0.5)
+            # Keep the figure open so the next draw can reuse it; see close()
+            self._figure_done = True
+
+    def close(self):
+        """Close the figure held by this visualizer, if any."""
+        if self.fig is not None:
             plt.close(self.fig)
+            self.fig = None
+            self.ax = None
+            self._figure_done = False
 
     def draw_resource_allocation_graph(self):
         """
         Draw the resource allocation graph for the current system state.
         """
-        # Create figure with specific size and DPI
-        self.fig, self.ax = plt.subplots(figsize=self.figsize, dpi=self.dpi)
-        
-        # Create and layout graph
-        self.G = self._create_graph()
-        pos = nx.spring_layout(self.G, 
-                             scale=self.layout_scale,
-                             seed=self.layout_seed,
-                             k=2.0)  # Increased repulsion
-        
-        # Draw nodes
-        nx.draw_networkx_nodes(self.G, pos,
-                             node_color=self._get_node_colors(self.G),
-                             node_shape='o',
-                             node_size=self._get_node_sizes(self.G),
-                             alpha=0.9)
-        
-        # Draw edges
-        nx.draw_networkx_edges(self.G, pos,
-                             edge_color=self._get_edge_colors(self.G),
-                             style=self._get_edge_styles(self.G),
-                             arrowsize=20,
-                             width=2,
-                             alpha=0.7)
-        
-        # Draw labels with background
-        label_pos = {node: (pos[node][0], pos[node][1] + 0.1) for node in self.G.nodes()}
-        nx.draw_networkx_labels(self.G, label_pos,
-                              labels={node: self.G.nodes[node]['label'] for node in self.G.nodes()},
-                              font_size=self.label_fontsize,
-                              font_weight='bold',
-                              bbox=dict(facecolor='white',
-                                      edgecolor='none',
-                                      alpha=0.7,
-                                      pad=3))
-        
-        # Add title
-        plt.title("Resource Allocation Graph",
-                 fontsize=self.title_fontsize,
-                 pad=20)
-        
-        # Add legend with padding
-        handles, labels = self._create_legend_elements()
-        legend = self.ax.legend(handles, labels,
-                              loc='upper right',
-                              bbox_to_anchor=(1.0, 1.0),
-                              fontsize=self.legend_fontsize)
-        
-        # Add padding around the plot
-        plt.margins(x=0.2, y=0.2)
-        
-        # Remove axis
-        self.ax.set_axis_off()
-        
-        # Adjust layout to prevent overlapping
-        plt.tight_layout(pad=3.0)
+        self._draw_state("Resource Allocation Graph")
 
     def draw_system_state(self):
         """
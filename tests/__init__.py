@@ -12,9 +12,9 @@ from .test_scenarios import (
     run_test_scenario
 )
 
-__all__ = [
+__all__ = (
     'create_simple_deadlock',
     'create_dining_philosophers',
     'create_resource_allocation_scenario',
     'run_test_scenario'
-]
+)
@@ -24,6 +24,7 @@ Available visualization types:
 
 import sys
 import argparse
+import logging
 from test_scenarios import (
     create_simple_deadlock,
     create_dining_philosophers,
@@ -33,6 +34,19 @@ from test_scenarios import (
     run_test_scenario
 )
 
+# Lookup tables built once at import rather than on every call
+SCENARIOS = {
+    'simple': ('Simple Two-Process Deadlock', create_simple_deadlock),
+    'dining-5': ('Dining Philosophers (5 philosophers)', lambda: create_dining_philosophers(5)),
+    'dining-3': ('Dining Philosophers (3 philosophers)', lambda: create_dining_philosophers(3)),
+    'dining-7': ('Dining Philosophers (7 philosophers)', lambda: create_dining_philosophers(7)),
+    'complex': ('Complex Resource Allocation', create_resource_allocation_scenario),
+    'no-deadlock': ('No Deadlock Scenario', create_no_deadlock_scenario),
+    'chain': ('Chain Deadlock', create_chain_deadlock)
+}
+
+VALID_VIZ_TYPES = frozenset({'rag', 'state', 'detection', 'resolution', 'all'})
+
 def parse_args():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(description='Run individual deadlock test scenarios')
@@ -43,39 +57,27 @@ def parse_args():
 
 def get_scenario_function(scenario_name):
     """Get the appropriate scenario function based on the scenario name."""
-    scenarios = {
-        'simple': ('Simple Two-Process Deadlock', create_simple_deadlock),
-        'dining-5': ('Dining Philosophers (5 philosophers)', lambda: create_dining_philosophers(5)),
-        'dining-3': ('Dining Philosophers (3 philosophers)', lambda: create_dining_philosophers(3)),
-        'dining-7': ('Dining Philosophers (7 philosophers)', lambda: create_dining_philosophers(7)),
-        'complex': ('Complex Resource Allocation', create_resource_allocation_scenario),
-        'no-deadlock': ('No Deadlock Scenario', create_no_deadlock_scenario),
-        'chain': ('Chain Deadlock', create_chain_deadlock)
-    }
-    
-    if scenario_name not in scenarios:
+    if scenario_name not in SCENARIOS:
         print(f"Error: Unknown scenario '{scenario_name}'")
         print("\nAvailable scenarios:")
-        for name, (full_name, _) in scenarios.items():
+        for name, (full_name, _) in SCENARIOS.items():
             print(f"  {name}: {full_name}")
         sys.exit(1)
     
-    return scenarios[scenario_name]
+    return SCENARIOS[scenario_name]
 
 def validate_viz_types(viz_types):
     """Validate and process visualization types."""
-    valid_types = {'rag', 'state', 'detection', 'resolution', 'all'}
-    
     if not viz_types:
         return ['all']
     
     types = [t.strip().lower() for t in viz_types.split(',')]
-    invalid_types = [t for t in types if t not in valid_types]
+    invalid_types = [t for t in types if t not in VALID_VIZ_TYPES]
     
     if invalid_types:
         print(f"Error: Invalid visualization types: {', '.join(invalid_types)}")
         print("\nAvailable visualization types:")
-        for t in valid_types:
+        for t in VALID_VIZ_TYPES:
             print(f"  {t}")
         sys.exit(1)
     
@@ -84,6 +86,7 @@ def validate_viz_types(viz_types):
 def main():
     """Main function to run the selected test scenario."""
     args = parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     scenario_name, scenario_func = get_scenario_function(args.scenario)
     
     # Process visualization types
@@ -6,10 +6,21 @@ This module provides various test scenarios to validate the correctness
 of the deadlock detection and resolution algorithms.
 """
 
+import io
+import logging
 from src.core import Process, Resource, System
 from src.detection import DeadlockDetector
 from src.resolution import DeadlockResolver
-from src.visualization.visualizer import DeadlockVisualizer
+
+# Banner strings are fixed, so build them once instead of on every call
+SEPARATOR = "=" * 50
+WIDE_SEPARATOR = "=" * 60
+ALL_SCENARIOS_BANNER = f"\n{WIDE_SEPARATOR}\nRUNNING ALL TEST SCENARIOS\n{WIDE_SEPARATOR}"
+SUMMARY_BANNER = f"\n{WIDE_SEPARATOR}\nOVERALL TEST SUMMARY\n{WIDE_SEPARATOR}"
+
+# Visualization types selected by 'all'
+VIZ_TYPES = frozenset({'rag', 'state', 'detection', 'resolution'})
+
 def create_simple_deadlock():
     """
     Create a simple deadlock scenario with two processes and two resources.
@@ -248,9 +259,7 @@ def run_test_scenario(scenario_func, scenario_name="", test_both_algorithms=True
     Returns:
         dict: Test results containing detection results and system state
     """
-    print(f"\n{'='*50}")
-    print(f"TESTING SCENARIO: {scenario_name or scenario_func.__name__}")
-    print(f"{'='*50}")
+    print(f"\n{SEPARATOR}\nTESTING SCENARIO: {scenario_name or scenario_func.__name__}\n{SEPARATOR}")
     
     # Create the system using the provided scenario
     system = scenario_func()
@@ -260,11 +269,15 @@ def run_test_scenario(scenario_func, scenario_name="", test_both_algorithms=True
     resolver = DeadlockResolver(system, detector)
     
     if visualize:
+        # Deferred so non-visual test runs never load matplotlib
+        from src.visualization.visualizer import DeadlockVisualizer
         visualizer = DeadlockVisualizer(system)
         if viz_types is None:
             viz_types = ['all']
         elif isinstance(viz_types, str):
             viz_types = [viz_types]
+        # Expand 'all' once so each view below is a single set lookup
+        viz_types = VIZ_TYPES if 'all' in viz_types else set(viz_types)
     
     # Print initial system state
     print("\n--- Initial System State ---")
@@ -314,43 +327,46 @@ def run_test_scenario(scenario_func, scenario_name="", test_both_algorithms=True
         # Test process termination
         print("\n🔥 Testing Process Termination Strategy:")
         restore_system_state(system, original_state)
-        termination_success = resolver._resolve_by_termination(rag_processes.copy(), priority_based=False)
+        termination_success = resolver._resolve_by_termination(rag_processes, priority_based=False)
+        termination_state = get_system_state_summary(system)
         resolution_results["termination"] = {
             "success": termination_success,
-            "final_state": get_system_state_summary(system)
+            "final_state": termination_state
         }
         resolution_steps.append({
             "strategy": "termination",
             "success": termination_success,
-            "state": get_system_state_summary(system)
+            "state": termination_state
         })
         
         # Test resource preemption
         print("\n🔄 Testing Resource Preemption Strategy:")
         restore_system_state(system, original_state)
-        preemption_success = resolver._resolve_by_preemption(rag_processes.copy(), priority_based=False)
+        preemption_success = resolver._resolve_by_preemption(rag_processes, priority_based=False)
+        preemption_state = get_system_state_summary(system)
         resolution_results["preemption"] = {
             "success": preemption_success,
-            "final_state": get_system_state_summary(system)
+            "final_state": preemption_state
         }
         resolution_steps.append({
             "strategy": "preemption",
             "success": preemption_success,
-            "state": get_system_state_summary(system)
+            "state": preemption_state
         })
         
         # Test rollback
         print("\n🔙 Testing Rollback Strategy:")
         restore_system_state(system, original_state)
-        rollback_success = resolver._resolve_by_rollback(rag_processes.copy(), priority_based=False)
+        rollback_success = resolver._resolve_by_rollback(rag_processes, priority_based=False)
+        rollback_state = get_system_state_summary(system)
         resolution_results["rollback"] = {
             "success": rollback_success,
-            "final_state": get_system_state_summary(system)
+            "final_state": rollback_state
         }
         resolution_steps.append({
             "strategy": "rollback",
             "success": rollback_success,
-            "state": get_system_state_summary(system)
+            "state": rollback_state
         })
         
         results["resolution_results"] = resolution_results
@@ -360,15 +376,15 @@ def run_test_scenario(scenario_func, scenario_name="", test_both_algorithms=True
     if visualize and 'visualizer' in locals():
         print("\n--- Generating Visualizations ---")
         
-        if 'all' in viz_types or 'rag' in viz_types:
+        if 'rag' in viz_types:
             print("\nVisualizing Resource Allocation Graph...")
             visualizer.draw_resource_allocation_graph()
         
-        if 'all' in viz_types or 'state' in viz_types:
+        if 'state' in viz_types:
             print("\nVisualizing System State...")
             visualizer.draw_system_state()
         
-        if 'all' in viz_types or 'detection' in viz_types:
+        if 'detection' in viz_types:
             print("\nVisualizing Deadlock Detection Steps...")
             detection_steps = []
             if rag_deadlocked:
@@ -378,7 +394,7 @@ def run_test_scenario(scenario_func, scenario_name="", test_both_algorithms=True
                 })
             visualizer.visualize_detection_steps(detection_steps)
         
-        if 'all' in viz_types or 'resolution' in viz_types:
+        if 'resolution' in viz_types:
             if rag_deadlocked and 'resolution_steps' in results:
                 print("\nVisualizing Resolution Steps...")
                 visualizer.visualize_resolution_steps(results["resolution_steps"])
@@ -420,9 +436,7 @@ def run_all_test_scenarios(visualize=False, viz_types=None):
     
     all_results = []
     
-    print("\n" + "="*60)
-    print("RUNNING ALL TEST SCENARIOS")
-    print("="*60)
+    print(ALL_SCENARIOS_BANNER)
     
     for scenario_func, scenario_name in scenarios:
         try:
@@ -439,9 +453,8 @@ def run_all_test_scenarios(visualize=False, viz_types=None):
             })
     
     # Print overall summary
-    print("\n" + "="*60)
-    print("OVERALL TEST SUMMARY")
-    print("="*60)
+    # Collect the summary and write it out in one go
+    summary = [SUMMARY_BANNER]
     
     deadlock_scenarios = 0
     no_deadlock_scenarios = 0
@@ -450,19 +463,20 @@ def run_all_test_scenarios(visualize=False, viz_types=None):
     for result in all_results:
         if "error" in result:
             error_scenarios += 1
-            print(f"❌ {result['scenario_name']}: ERROR - {result['error']}")
+            summary.append(f"❌ {result['scenario_name']}: ERROR - {result['error']}")
         elif result.get("detection_results", {}).get("rag", {}).get("deadlocked", False):
             deadlock_scenarios += 1
             processes = result["detection_results"]["rag"]["processes"]
-            print(f"🔴 {result['scenario_name']}: DEADLOCK (Processes: {processes})")
+            summary.append(f"🔴 {result['scenario_name']}: DEADLOCK (Processes: {processes})")
         else:
             no_deadlock_scenarios += 1
-            print(f"🟢 {result['scenario_name']}: NO DEADLOCK")
+            summary.append(f"🟢 {result['scenario_name']}: NO DEADLOCK")
     
-    print(f"\nTotal scenarios tested: {len(all_results)}")
-    print(f"Deadlock scenarios: {deadlock_scenarios}")
-    print(f"No deadlock scenarios: {no_deadlock_scenarios}")
-    print(f"Error scenarios: {error_scenarios}")
+    summary.append(f"\nTotal scenarios tested: {len(all_results)}")
+    summary.append(f"Deadlock scenarios: {deadlock_scenarios}")
+    summary.append(f"No deadlock scenarios: {no_deadlock_scenarios}")
+    summary.append(f"Error scenarios: {error_scenarios}")
+    print("\n".join(summary))
     
     return all_results
 
@@ -470,16 +484,18 @@ def run_all_test_scenarios(visualize=False, viz_types=None):
 
 def print_system_summary(system):
     """Print a summary of the current system state."""
-    print(f"Processes: {len(system.processes)}")
+    buf = io.StringIO()
+    print(f"Processes: {len(system.processes)}", file=buf)
     for pid, process in system.processes.items():
         held_resources = [r.rid for r in process.resources_held]
         requested_resources = [r.rid for r in process.resources_requested]
-        print(f"  P{pid} ({process.status}): Holds {held_resources}, Requests {requested_resources}")
+        print(f"  P{pid} ({process.status}): Holds {held_resources}, Requests {requested_resources}", file=buf)
     
-    print(f"Resources: {len(system.resources)}")
+    print(f"Resources: {len(system.resources)}", file=buf)
     for rid, resource in system.resources.items():
         print(f"  R{rid}: {resource.available_instances}/{resource.total_instances} available, "
-              f"allocated to {resource.allocated_to}")
+              f"allocated to {resource.allocated_to}", file=buf)
+    print(buf.getvalue(), end="")
 
 
 
@@ -543,6 +559,8 @@ def restore_system_state(system, saved_state):
 
 # Main execution for testing
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
     # Run all scenarios with specific visualizations
     run_all_test_scenarios(visualize=True, viz_types=['rag', 'state', 'detection', 'resolution'])
 